@@ -1,13 +1,18 @@
 import eventlet
 eventlet.monkey_patch()
 
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash
+from flask import Flask, Response, abort, g, render_template, request, redirect, url_for, session, jsonify, flash
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, join_room, emit, disconnect
-from copy import deepcopy
+from functools import lru_cache
+from operator import itemgetter
 import os
-import json
+import atexit
+import hashlib
 import secrets
-from typing import List, Dict, Union, Callable, Any, Optional
+from threading import Lock
+import orjson
+from typing import List, Dict, Tuple, Union, Callable, Any, Optional
 
 import read_localized_text as localized_text
 
@@ -16,8 +21,6 @@ from backend.card_related.system_driver import System
 from backend.card_related.static_card_base import StaticCardBase, StaticSystemBase
 
 from backend.chess_related.board import Board
-from backend.chess_related.piece import BasePiece, KingPiece, QueenPiece, BishopPiece, KnightPiece, RookPiece, PawnPiece, NonePiece
-from backend.chess_related.chess_utils import *
 
 from backend.controller_related.event_controller import EventHandler
 
@@ -34,14 +37,83 @@ DATABASE_DIR = os.path.join("database", "website")
 
 
 
+SECRET_KEY_FILE = os.path.join(BASE_DIR, DATABASE_DIR, ".secret_key")
+SECRET_KEY_BYTES = 32
+
+def read_secret_key(path: str) -> Optional[bytes]:
+    """Return the key stored at `path`, or None if it is missing or not a full-length key."""
+    try:
+        with open(path, 'rb') as f:
+            secret_key = f.read()
+    except FileNotFoundError:
+        return None
+    return secret_key if len(secret_key) == SECRET_KEY_BYTES else None
+
+def load_or_create_secret_key(path: str) -> bytes:
+    """
+    Return the session signing key stored at `path`, creating it on first run
+    so every restart signs cookies with the same key.
+
+    The file is created exclusively, so only one process ever writes a new key.
+    An empty or truncated file left by a crash fails the length check and is
+    treated as missing: it is overwritten with a fresh key.
+    """
+    secret_key = read_secret_key(path)
+    if secret_key is not None:
+        return secret_key
+
+    new_key = secrets.token_bytes(SECRET_KEY_BYTES)
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except FileExistsError:
+        secret_key = read_secret_key(path)
+        if secret_key is not None:
+            return secret_key  # Another process created it first; use its key
+        fd = os.open(path, os.O_TRUNC | os.O_WRONLY)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(new_key)
+        f.flush()
+        os.fsync(f.fileno())
+    return new_key
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; keys keep insertion order like `sort_keys = False`."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+class OrjsonSocketIOJson:
+    """Drop-in `json` module for python-socketio packet encoding."""
+    
+    @staticmethod
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    @staticmethod
+    def loads(s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 app = Flask(
     __name__,
     template_folder=os.path.join(BASE_DIR, "templates"),
     static_folder=os.path.join(BASE_DIR, "static")
 )
+app.json = OrjsonProvider(app)
 app.json.sort_keys = False
-app.secret_key = secrets.token_bytes(32)
-socketio = SocketIO(app, async_mode='eventlet')
+# A fixed key keeps sessions valid across restarts
+app.secret_key = os.environ.get("FLASK_SECRET_KEY") or load_or_create_secret_key(SECRET_KEY_FILE)
+# Set SOCKETIO_MESSAGE_QUEUE (e.g. redis://localhost:6379/0) only so other processes can emit to
+# clients. Game rooms, locks and the JSON write-behind caches live in this process, so run exactly
+# one game worker.
+socketio = SocketIO(
+    app,
+    async_mode='eventlet',
+    message_queue=os.environ.get("SOCKETIO_MESSAGE_QUEUE"),
+    json=OrjsonSocketIOJson
+)
 
 global_event_handler = EventHandler()
 
@@ -53,6 +125,14 @@ PLAYER_DECK_FILE = 'player_decks.json'
 
 games: Dict[str, Dict[str, Union[str, Board, Dict[str, Player], GameController]]] = {}
 
+OPPONENT_COLOR = {'white': 'black', 'black': 'white'}
+
+# Users, leaderboard and decks are kept in memory; writes are batched to disk
+cached_json_files: Dict[str, Dict] = {}
+dirty_json_files: set = set()
+JSON_FLUSH_INTERVAL_SECONDS = 2
+sorted_leaderboard_cache: Optional[List[Tuple[str, int]]] = None
+
 # Decorators
 def set_event_handler(event_name: str):
     """
@@ -69,54 +149,193 @@ def set_event_handler(event_name: str):
 
 # Helper functions
 
+@lru_cache(maxsize=None)
 def get_full_file_path(dirname: str, filename: str) -> str:
+    # Only a handful of fixed paths are ever built, so join each one once
     return os.path.join(BASE_DIR, dirname, filename)
 
 def init_files():
-    if not os.path.exists(get_full_file_path(DATABASE_DIR, USERS_FILE)):
-        with open(get_full_file_path(DATABASE_DIR, USERS_FILE), 'w') as f:
-            json.dump({}, f)
-    if not os.path.exists(get_full_file_path(DATABASE_DIR, LEADERBOARD_FILE)):
-        with open(get_full_file_path(DATABASE_DIR, LEADERBOARD_FILE), 'w') as f:
-            json.dump({}, f)
+    for filename in (USERS_FILE, LEADERBOARD_FILE):
+        # Exclusive create: one syscall, and never clobbers a file that appeared meanwhile
+        try:
+            with open(get_full_file_path(DATABASE_DIR, filename), 'xb') as f:
+                f.write(orjson.dumps({}))
+        except FileExistsError:
+            pass
+    
+    # Parse both files once at startup so no request pays for the first read
+    load_users()
+    load_leaderboard()
+
+def load_cached_json(filename: str) -> Dict:
+    """
+    Return the in-memory copy of a JSON "database" file, reading it from disk
+    only the first time it is requested.
+    """
+    if filename not in cached_json_files:
+        with open(get_full_file_path(DATABASE_DIR, filename), 'rb') as f:
+            cached_json_files[filename] = orjson.loads(f.read())
+    return cached_json_files[filename]
+
+def save_cached_json(filename: str, data: Dict):
+    """
+    Replace the in-memory copy of a JSON "database" file and mark it dirty.
+    The actual disk write is done later by `cached_json_flush_loop`.
+    """
+    cached_json_files[filename] = data
+    dirty_json_files.add(filename)
+
+def flush_cached_json():
+    """
+    Write every dirty JSON "database" file back to disk atomically.
+
+    A file that fails to write stays dirty, so the next flush retries it
+    instead of silently dropping the change.
+    """
+    for filename in list(dirty_json_files):
+        # Cleared up front so a change made while writing marks it dirty again
+        dirty_json_files.discard(filename)
+        full_path = get_full_file_path(DATABASE_DIR, filename)
+        temp_path = full_path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(orjson.dumps(cached_json_files[filename]))
+                # Make sure the data is on disk before the rename makes it visible
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, full_path)
+        except (OSError, TypeError) as e:
+            dirty_json_files.add(filename)
+            print(f"[ERROR] Failed to write {filename}: {e}")
+
+def cached_json_flush_loop():
+    """Background task: periodically persist whatever changed since the last flush."""
+    while True:
+        socketio.sleep(JSON_FLUSH_INTERVAL_SECONDS)
+        try:
+            flush_cached_json()
+        except Exception as e:
+            # Never let one bad flush end the task; dirty files are retried next round
+            print(f"[ERROR] JSON flush failed: {e}")
 
 def load_users():
-    with open(get_full_file_path(DATABASE_DIR, USERS_FILE), 'r') as f:
-        return json.load(f)
+    return load_cached_json(USERS_FILE)
 
 def save_users(users):
-    with open(get_full_file_path(DATABASE_DIR, USERS_FILE), 'w') as f:
-        json.dump(users, f)
+    save_cached_json(USERS_FILE, users)
 
 def load_leaderboard():
-    with open(get_full_file_path(DATABASE_DIR, LEADERBOARD_FILE), 'r') as f:
-        return json.load(f)
+    return load_cached_json(LEADERBOARD_FILE)
+
+def load_decks() -> Dict[str, List[Dict]]:
+    """
+    In-memory player decks; a missing file starts an empty store.
+
+    A corrupt file is moved aside first, so the next flush can't overwrite
+    the only copy of the old decks. Other read errors propagate uncached.
+    """
+    try:
+        return load_cached_json(PLAYER_DECK_FILE)
+    except FileNotFoundError:
+        pass
+    except orjson.JSONDecodeError:
+        full_path = get_full_file_path(DATABASE_DIR, PLAYER_DECK_FILE)
+        os.replace(full_path, full_path + '.corrupt')
+        print(f"[ERROR] {PLAYER_DECK_FILE} is corrupt; moved to {full_path}.corrupt")
+    cached_json_files[PLAYER_DECK_FILE] = {}
+    return cached_json_files[PLAYER_DECK_FILE]
+
+def save_decks(decks):
+    save_cached_json(PLAYER_DECK_FILE, decks)
 
 def save_leaderboard(leaderboard):
-    with open(get_full_file_path(DATABASE_DIR, LEADERBOARD_FILE), 'w') as f:
-        json.dump(leaderboard, f)
-
-def replace_placeholders_in_localized_text(texts_dict: Dict[str, Dict[str, str]], username: str = "Player"):
-    for text_key in texts_dict:
-        text_object = texts_dict[text_key]
-        if "description" not in text_object:
-            continue
-        text_content = text_object["description"]
-        
-        replaced = text_content \
-            .replace("[linebreak]", "<br />") \
-            .replace("[username]", username)
-        
-        texts_dict[text_key]["description"] = replaced
-    
-    return texts_dict
+    global sorted_leaderboard_cache
+    sorted_leaderboard_cache = None
+    save_cached_json(LEADERBOARD_FILE, leaderboard)
+
+def get_sorted_leaderboard() -> List[Tuple[str, int]]:
+    """Leaderboard entries by score, highest first; re-sorted only after a save."""
+    global sorted_leaderboard_cache
+    if sorted_leaderboard_cache is None:
+        sorted_leaderboard_cache = sorted(load_leaderboard().items(), key=itemgetter(1), reverse=True)
+    return sorted_leaderboard_cache
+
+def tokenize_localized_descriptions(texts_dict: Dict[str, Dict[str, str]]) -> Dict[str, List[str]]:
+    """
+    Split every description that has placeholders into the fragments around
+    "[username]", with "[linebreak]" already resolved. Descriptions without
+    placeholders are left out.
+    """
+    return {
+        text_key: text_object["description"].replace("[linebreak]", "<br />").split("[username]")
+        for text_key, text_object in texts_dict.items()
+        if "[" in text_object.get("description", "")
+    }
+
+def replace_placeholders_in_localized_text(
+        texts_dict: Dict[str, Dict[str, str]],
+        description_fragments: Dict[str, List[str]],
+        username: str = "Player"
+    ) -> Dict[str, Dict[str, str]]:
+    """Return a copy of `texts_dict` with placeholders substituted; the input is left untouched."""
+    return {
+        text_key: (
+            {**text_object, "description": username.join(description_fragments[text_key])}
+            if text_key in description_fragments
+            else text_object  # No placeholders; share the cached entry
+        )
+        for text_key, text_object in texts_dict.items()
+    }
+
+@lru_cache(maxsize=16)
+def get_cached_localized_data(language: str, get_method: Callable[..., Dict[str, Dict[str, str]]]) -> Dict[str, Dict[str, str]]:
+    """Parsed and tag-resolved data per (source, language); shared, so never mutate the result."""
+    return localized_text.get_all_data(get_method, language)
+
+@lru_cache(maxsize=16)
+def get_cached_description_fragments(language: str, get_method: Callable[..., Dict[str, Dict[str, str]]]) -> Dict[str, List[str]]:
+    return tokenize_localized_descriptions(get_cached_localized_data(language, get_method))
+
+@lru_cache(maxsize=256)
+def get_cached_user_localized_data(language: str, get_method: Callable[..., Dict[str, Dict[str, str]]], username: str) -> Dict[str, Dict[str, str]]:
+    """Placeholder-substituted data for recently active usernames; shared, so never mutate the result."""
+    return replace_placeholders_in_localized_text(
+        get_cached_localized_data(language, get_method),
+        get_cached_description_fragments(language, get_method),
+        username
+    )
+
+@lru_cache(maxsize=256)
+def get_cached_localized_json(language: str, get_method: Callable[..., Dict[str, Dict[str, str]]], username: str) -> Tuple[bytes, str]:
+    """Serialized localization payload and its ETag, so repeat API hits skip encoding entirely."""
+    body = orjson.dumps(get_cached_user_localized_data(language, get_method, username))
+    return body, hashlib.blake2b(body, digest_size=8).hexdigest()
+
+@lru_cache(maxsize=None)
+def get_supported_languages() -> frozenset:
+    """Languages with a readable localization file; anything else is rejected up front."""
+    return frozenset(
+        language
+        for language, replacement_tags in localized_text.get_all_localization().items()
+        if replacement_tags is not None
+    )
+
+def localized_json_response(language: str, get_method: Callable[..., Dict[str, Dict[str, str]]], username: str) -> Response:
+    if language not in get_supported_languages():
+        abort(404)
+    body, etag = get_cached_localized_json(language, get_method, username)
+    response = Response(body, mimetype="application/json")
+    # Personalized (username): let the browser keep a copy, but revalidate it
+    # against the ETag on every load so a different login never sees stale text
+    response.headers["Cache-Control"] = "private, no-cache"
+    response.set_etag(etag)
+    # Answers 304 with no body when the client's If-None-Match still matches
+    return response.make_conditional(request)
 
 def get_data_with_localization(language: str, get_method: Callable[..., Dict[str, Dict[str, str]]], **kwargs):
     username = kwargs["username"] if "username" in kwargs else "Player"
     
-    data = localized_text.get_all_data(get_method, language)
-    data = replace_placeholders_in_localized_text(data, username)
-    return data
+    return get_cached_user_localized_data(language, get_method, username)
 
 def change_json_card_object_into_card_id_list(cards: List) -> List[str]:
     return [card["id"] for card in cards]
@@ -154,8 +373,7 @@ def change_json_system_id_into_system_object(system_id: str) -> Optional[System]
 
 def get_active_deck_details(username: str) -> Optional[Dict[str, Union[str, List[str]]]]:
     try:
-        with open(get_full_file_path(DATABASE_DIR, PLAYER_DECK_FILE), 'r') as f:
-            decks: Dict[str, Dict] = json.load(f)
+        decks = load_decks()
         current_player_deck = next((deck for deck in decks[username] if deck.get("active") == "true"), None)
         return current_player_deck
     except:
@@ -213,6 +431,20 @@ def server_start():
     # 5. Register global event handler
     global_event_handler.on("select", handle_select_event)
 
+    # 6. Persist users/leaderboard changes in the background, and once more on shutdown
+    socketio.start_background_task(cached_json_flush_loop)
+    atexit.register(flush_cached_json)
+
+    # 7. Parse and tokenize every localized source now, so the first player's request doesn't pay for it
+    for language in get_supported_languages():
+        for get_method in (localized_text.get_skills, localized_text.get_cards, localized_text.get_systems):
+            get_cached_description_fragments(language, get_method)
+
+@app.before_request
+def attach_username():
+    """Resolve the session user once per request; API handlers read `g.username`."""
+    g.username = session.get("username", "Player")
+
 @app.route('/')
 def no_path():
     return redirect(url_for("home"))
@@ -261,28 +493,24 @@ def get_rooms():
 
 @app.route('/api/localization/<language>/skills', methods=['GET'])
 def get_skills(language: str):    
-    username = session.get("username", "Player")
-    skills = get_data_with_localization(language, localized_text.get_skills, username=username)
-    return jsonify(skills)
+    username = g.username
+    return localized_json_response(language, localized_text.get_skills, username)
 
 @app.route('/api/localization/<language>/cards', methods=['GET'])
 def get_cards(language: str):
-    username = session.get("username", "Player")
-    cards = get_data_with_localization(language, localized_text.get_cards, username=username)
-    return jsonify(cards)
+    username = g.username
+    return localized_json_response(language, localized_text.get_cards, username)
 
 @app.route('/api/localization/<language>/systems', methods=['GET'])
 def get_systems(language: str):
-    username = session.get("username", "Player")
-    systems = get_data_with_localization(language, localized_text.get_systems, username=username)
-    return jsonify(systems)
+    username = g.username
+    return localized_json_response(language, localized_text.get_systems, username)
 
 @app.route('/api/get_deck')
 def get_deck():
-    username = session.get("username", "Player")
+    username = g.username
     try:
-        with open(get_full_file_path(DATABASE_DIR, PLAYER_DECK_FILE), 'r') as f:
-            decks = json.load(f)
+        decks = load_decks()
         return jsonify(decks[username])
     except:
         return jsonify([])
@@ -290,7 +518,7 @@ def get_deck():
 @app.route('/api/save_deck', methods=['POST'])
 def save_deck():
     data = request.get_json()
-    username = session.get("username", "Player")
+    username = g.username
     
     deck_id = data["id"]
     deck_name = data["name"]
@@ -298,66 +526,54 @@ def save_deck():
     deck_system = change_json_system_object_into_system_id(data["system"])
     deck_active = data["active"]
     
-    with open(get_full_file_path(DATABASE_DIR, PLAYER_DECK_FILE), 'r') as f:
-        try:
-            decks = json.load(f)
-        except:
-            decks = {}
-    
-        if username in decks:
-            player_original_decks = decks[username]
-            if deck_id < player_original_decks.__len__():
-                player_original_decks[deck_id] = {
-                    "name": deck_name,
-                    "system": deck_system,
-                    "deck": deck_cards,
-                    "active": deck_active
-                }
-            else:
-                player_original_decks.append({
-                    "name": deck_name,
-                    "system": deck_system,
-                    "deck": deck_cards,
-                    "active": deck_active
-                })
+    decks = load_decks()
+
+    if username in decks:
+        player_original_decks = decks[username]
+        if deck_id < len(player_original_decks):
+            player_original_decks[deck_id] = {
+                "name": deck_name,
+                "system": deck_system,
+                "deck": deck_cards,
+                "active": deck_active
+            }
         else:
-            decks[username] = [{
+            player_original_decks.append({
                 "name": deck_name,
                 "system": deck_system,
                 "deck": deck_cards,
                 "active": deck_active
-            }]
-        
-    with open(get_full_file_path(DATABASE_DIR, PLAYER_DECK_FILE), 'w') as f:
-        json.dump(decks, f)
+            })
+    else:
+        decks[username] = [{
+            "name": deck_name,
+            "system": deck_system,
+            "deck": deck_cards,
+            "active": deck_active
+        }]
+    
+    save_decks(decks)
     
     return jsonify({"success": True, "decks": decks[username]})
 
 @app.route('/api/delete_deck', methods=['POST'])
 def delete_deck():
     data = request.get_json()
-    username = session.get("username", "Player")
+    username = g.username
     
     try:
-        with open(get_full_file_path(DATABASE_DIR, PLAYER_DECK_FILE), 'r') as f:
-            try:
-                decks = json.load(f)
-            except:
-                decks = {}
-                
-            deck_id = int(data["id"])
-                
+        decks = load_decks()
+        deck_id = int(data["id"])
         
-            if username in decks:
-                player_original_decks = decks[username]
-                
-                if deck_id < 0 or deck_id >= len(player_original_decks):
-                    return jsonify({"success": False, "error": "Invalid deck ID"})
-                
-                del player_original_decks[deck_id]
+        if username in decks:
+            player_original_decks = decks[username]
+            
+            if deck_id < 0 or deck_id >= len(player_original_decks):
+                return jsonify({"success": False, "error": "Invalid deck ID"})
+            
+            del player_original_decks[deck_id]
         
-        with open(get_full_file_path(DATABASE_DIR, PLAYER_DECK_FILE), 'w') as f:
-            json.dump(decks, f)
+        save_decks(decks)
     
         return jsonify({"success": True, "decks": decks[username]})
     except:
@@ -366,34 +582,22 @@ def delete_deck():
 @app.route('/api/set_active_deck', methods=['POST'])
 def set_active_deck():
     data = request.get_json()
-    username = session.get("username", "Player")
+    username = g.username
     
     try:
-        with open(get_full_file_path(DATABASE_DIR, PLAYER_DECK_FILE), 'r') as f:
-            try:
-                decks = json.load(f)
-            except:
-                decks = {}
-                
-            deck_id = int(data["id"])
-                
+        decks = load_decks()
+        deck_id = int(data["id"])
         
-            if username in decks:
-                player_original_decks = decks[username]
-                
-                if deck_id < 0 or deck_id >= len(player_original_decks):
-                    return jsonify({"success": False, "error": "Invalid deck ID"})
-                
-                i = 0
-                for deck in player_original_decks:
-                    if i == deck_id:
-                        deck["active"] = "true"
-                    else:
-                        deck["active"] = "false"
-                    i += 1
+        if username in decks:
+            player_original_decks = decks[username]
+            
+            if deck_id < 0 or deck_id >= len(player_original_decks):
+                return jsonify({"success": False, "error": "Invalid deck ID"})
+            
+            for i, deck in enumerate(player_original_decks):
+                deck["active"] = "true" if i == deck_id else "false"
         
-        with open(get_full_file_path(DATABASE_DIR, PLAYER_DECK_FILE), 'w') as f:
-            json.dump(decks, f)
+        save_decks(decks)
     
         return jsonify({"success": True, "decks": decks[username]})
     except:
@@ -415,9 +619,7 @@ def deckbuilder():
 def leaderboard():
     if 'username' not in session:
         return redirect(url_for('login'))
-    leaderboard = load_leaderboard()
-    sorted_leaderboard = sorted(leaderboard.items(), key=lambda x: x[1], reverse=True)
-    return render_template('leaderboard.html', leaderboard=sorted_leaderboard, username=session['username'])
+    return render_template('leaderboard.html', leaderboard=get_sorted_leaderboard(), username=session['username'])
 
 @app.route('/logout')
 def logout():
@@ -452,7 +654,9 @@ def on_join(data):
             'controller': None,
             'board': None,
             'turn': 'white',
-            'players': {}  # color → Player object
+            'players': {},  # color → Player object
+            'sid_to_color': {},  # sid → color, so handlers don't scan players
+            'lock': Lock()  # serializes state changes within this room
         }
 
     game = games[room]
@@ -493,6 +697,7 @@ def on_join(data):
         deck=deck,
         system=system
     )
+    game['sid_to_color'][sid] = color
     
     session['room'] = room
 
@@ -651,53 +856,33 @@ def on_make_move(data):
     game = games[room]
     controller: GameController = game.get("controller")
     
-    # Find which player is trying to play
-    current_player_color = controller.current_player
-    current_player_obj = game['players'].get(current_player_color)
-
-    if current_player_obj.sid != sid:
-        emit("error", {"msg": "It's not your turn!"}, to=sid)
-        return
-    
-    print("Received move request!", move_data)
-    
-    promotion = move_data["promotion"]
-    move_result = controller.move_piece({
-            'from': move_data['from'],
-            'to': move_data['to'],
-            'promotion': promotion,
-    })
-    success = move_result["success"]
-    en_passant = move_result["en_passant"]
-    win = move_result["win"]
+    # Serialize moves within a room; other rooms are unaffected
+    with game['lock']:
+        if room not in games:
+            return  # Game ended while waiting for the lock
+
+        # Check the turn under the lock so it can't go stale before the move
+        current_player_color = controller.current_player
+        current_player_obj = game['players'].get(current_player_color)
+
+        if current_player_obj.sid != sid:
+            emit("error", {"msg": "It's not your turn!"}, to=sid)
+            return
+        
+        print("Received move request!", move_data)
     
-    if win:
-        emit('move_made', {
-            'move': {
+        promotion = move_data["promotion"]
+        move_result = controller.move_piece({
                 'from': move_data['from'],
                 'to': move_data['to'],
                 'promotion': promotion,
-                'en_passant': en_passant,
-                'success': success
-            }
-        }, room=room)
-        emit('game_over', {
-            'winner': current_player_color,
-            'msg': f'{current_player_obj.username} wins!'
-        }, room=room)
-        del games[room]
-    elif success:
-        emit('move_made', {
-            'move': {
-                'from': move_data['from'],
-                'to': move_data['to'],
-                'promotion': promotion,
-                'en_passant': en_passant,
-                'success': success
-            }
-        }, room=room)
-    else :
-        emit('move_fails', {
+        })
+        success = move_result["success"]
+        en_passant = move_result["en_passant"]
+        win = move_result["win"]
+
+        # Same payload for every outcome; build it once
+        move_payload = {
             'move': {
                 'from': move_data['from'],
                 'to': move_data['to'],
@@ -705,7 +890,19 @@ def on_make_move(data):
                 'en_passant': en_passant,
                 'success': success
             }
-        }, to=sid)
+        }
+
+        if win:
+            emit('move_made', move_payload, room=room)
+            emit('game_over', {
+                'winner': current_player_color,
+                'msg': f'{current_player_obj.username} wins!'
+            }, room=room)
+            games.pop(room, None)
+        elif success:
+            emit('move_made', move_payload, room=room)
+        else :
+            emit('move_fails', move_payload, to=sid)
 
 @socketio.on('request_turn_end')
 def on_turn_end(data):
@@ -744,23 +941,23 @@ def on_turn_end(data):
 
 @socketio.on('resign')
 def on_resign(data):
-    room = data['room']
+    room = session.get('room') or (data or {}).get('room')
     if room not in games:
         return
     game = games[room]
-    sid = request.sid
-    for col, s in game['players'].items():
-        if s == sid:
-            loser = col
-            break
-    else:
+    loser = game['sid_to_color'].get(request.sid)
+    if not loser:
         return
-    winner = 'black' if loser == 'white' else 'white'
-    leaderboard = load_leaderboard()
-    leaderboard[game['usernames'][winner]] += 1
-    save_leaderboard(leaderboard)
-    emit('game_over', {'winner': winner, 'msg': f'{winner.capitalize()} wins by resignation!'}, room=room)
-    del games[room]
+    winner = OPPONENT_COLOR[loser]
+    winner_player = game['players'].get(winner)
+    with game['lock']:
+        if games.pop(room, None) is None:
+            return  # Game already ended while waiting for the lock
+        if winner_player:
+            leaderboard = load_leaderboard()
+            leaderboard[winner_player.username] = leaderboard.get(winner_player.username, 0) + 1
+            save_leaderboard(leaderboard)
+        emit('game_over', {'winner': winner, 'msg': f'{winner.capitalize()} wins by resignation!'}, room=room)
 
 @socketio.on('disconnect')
 def on_disconnect():
@@ -784,41 +981,42 @@ def on_disconnect():
     print(f"Checking if game exists...")
 
     # Find which player disconnected
-    disconnected_color = None
-    for color, player in game['players'].items():
-        if player.sid == sid:
-            disconnected_color = color
-            break
+    disconnected_color = game['sid_to_color'].get(sid)
 
     if not disconnected_color:
         return  # Wasn't a player in the game
 
-    # Notify the remaining player (if any) that opponent left
-    opponent_color = 'black' if disconnected_color == 'white' else 'white'
-    opponent_player = game['players'].get(opponent_color)
-
-    if opponent_player:
-        emit('game_over', {
-            'winner': opponent_color,
-            'msg': f'{username} disconnected. You win by forfeit!'
-        }, to=opponent_player.sid)
-
-    # Optional: Update leaderboard (win by forfeit)
-    leaderboard = load_leaderboard()
-    if not leaderboard:
-        leaderboard = {}
-    if opponent_player:
-        winner_name = opponent_player.username
-        leaderboard[winner_name] = leaderboard.get(winner_name, 0) + 1
-        save_leaderboard(leaderboard)
-    
-    controller: GameController = games[room].get('controller')
-    if controller and hasattr(controller, '_pending_selection'):
-        controller.cancel_selection()
+    # Same lock as moves and resignation, so a game is only ever ended once
+    with game['lock']:
+        if room not in games:
+            return  # Game already ended while waiting for the lock
+
+        # Notify the remaining player (if any) that opponent left
+        opponent_color = OPPONENT_COLOR[disconnected_color]
+        opponent_player = game['players'].get(opponent_color)
+
+        if opponent_player:
+            emit('game_over', {
+                'winner': opponent_color,
+                'msg': f'{username} disconnected. You win by forfeit!'
+            }, to=opponent_player.sid)
+
+        # Optional: Update leaderboard (win by forfeit)
+        leaderboard = load_leaderboard()
+        if not leaderboard:
+            leaderboard = {}
+        if opponent_player:
+            winner_name = opponent_player.username
+            leaderboard[winner_name] = leaderboard.get(winner_name, 0) + 1
+            save_leaderboard(leaderboard)
+        
+        controller: GameController = game.get('controller')
+        if controller and hasattr(controller, '_pending_selection'):
+            controller.cancel_selection()
 
-    # Clean up the room
-    print(f"Player {username} ({disconnected_color}) confirmed be disconnected. Destroying room {room}")
-    del games[room]
+        # Clean up the room
+        print(f"Player {username} ({disconnected_color}) confirmed be disconnected. Destroying room {room}")
+        games.pop(room, None)
 
     # Optional: clear session room
     session.pop('room', None)
@@ -946,4 +1144,5 @@ def handle_prestige_updated_event(data):
 server_start()
 
 if __name__ == '__main__':
-    socketio.run(app, host='0.0.0.0', debug=True)
\ No newline at end of file
+    # Debug mode (reloader + debugger) only when asked for; production runs under gunicorn's eventlet worker
+    socketio.run(app, host='0.0.0.0', debug=os.environ.get("FLASK_DEBUG") == "1")
\ No newline at end of file
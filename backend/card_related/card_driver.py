@@ -12,9 +12,8 @@ This module implements core deck and card logic commonly needed in digital card
 
 from __future__ import annotations
 
-from typing import List, Callable, Optional
-from random import shuffle, randrange, sample
-from copy import deepcopy
+from typing import List, Set, Callable, Optional
+from random import shuffle, sample, choices
 from uuid import UUID, uuid4
 
 
@@ -23,37 +22,38 @@ class StatusControllable:
     Mixin-style base class providing simple string-based status tracking.
 
     Statuses are useful for temporary flags such as "tapped", "observed", "summoning-sick",
-    "revealed", etc.
+    "revealed", etc. They are kept in a set, so adding, checking and removing a
+    flag costs the same no matter how many the object already carries.
     """
 
+    __slots__ = ("status",)
+
     def __init__(self) -> None:
-        self.status: List[str] = []
+        self.status: Set[str] = set()
 
-    def append_status(self, status: str) -> List[str]:
-        """Add a status if not already present. Returns the current status list."""
-        if status not in self.status:
-            self.status.append(status)
+    def append_status(self, status: str) -> Set[str]:
+        """Add a status if not already present. Returns the current status set."""
+        self.status.add(status)
         return self.status
 
     def has_status(self, status: str = "") -> bool:
         """Return True if the object has the given status."""
         return status in self.status
 
-    def remove_status(self, status: str = "") -> List[str]:
+    def remove_status(self, status: str = "") -> Set[str]:
         """
         Remove a status if present.
 
         Returns:
-            A copy of the status list before removal.
+            A copy of the status set before removal.
         """
-        previous = deepcopy(self.status)
-        if status in self.status:
-            self.status.remove(status)
+        previous = self.status.copy()
+        self.status.discard(status)
         return previous
 
-    def clear_status(self) -> List[str]:
-        """Clear all statuses and return the previous list."""
-        previous = deepcopy(self.status)
+    def clear_status(self) -> Set[str]:
+        """Clear all statuses and return the previous set."""
+        previous = self.status.copy()
         self.status.clear()
         return previous
 
@@ -68,6 +68,8 @@ class Card(StatusControllable):
     Each actual object in play gets its own UUID so it can be tracked individually.
     """
 
+    __slots__ = ("name", "id", "img", "uuid", "desc", "cost", "type")
+
     def __init__(self, name: str, id: str, img: str, desc: str, cost: int, type: str) -> None:
         super().__init__()
         self.name: str = name
@@ -78,16 +80,34 @@ class Card(StatusControllable):
         self.cost: int = cost
         self.type: str = type
 
+    def clone(self) -> Card:
+        """
+        Return an independent copy of this card with a blank UUID.
+
+        Every field except ``status`` is immutable, so only the status set
+        needs copying; this is much cheaper than ``copy.deepcopy``.
+        """
+        new_card = self.__class__.__new__(self.__class__)
+        for attr in Card.__slots__:
+            setattr(new_card, attr, getattr(self, attr))
+        new_card.status = self.status.copy()
+        new_card.uuid = UUID(int=0)
+        return new_card
+
     def __repr__(self) -> str:
         return f"<Card {self.name!r} (id={self.id}) uuid={self.uuid}>"
 
+    # Deck instances compare by UUID. Templates all share UUID(int=0), so they
+    # compare by template id instead of all colliding into one hash bucket.
     def __hash__(self) -> int:
-        return hash(self.uuid)
+        return hash(self.uuid if self.uuid.int else self.id)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Card):
             return NotImplemented
-        return self.uuid == other.uuid
+        if self.uuid.int or other.uuid.int:
+            return self.uuid == other.uuid
+        return self.id == other.id
 
 
 class Deck(StatusControllable):
@@ -107,7 +127,7 @@ class Deck(StatusControllable):
         """
         Create a deck from a list of card templates.
 
-        Each template is deep-copied, given a fresh UUID, and marked with the
+        Each template is cloned, given a fresh UUID, and marked with the
         ``"added_into_deck"`` status.
         """
         super().__init__()
@@ -121,33 +141,55 @@ class Deck(StatusControllable):
 
     def add(self, card: Card, idx: Optional[int] = None) -> None:
         """
-        Insert a deep copy of *card* into the deck.
+        Insert a copy of *card* into the deck.
 
         Args:
             card: Card template to add.
             idx: Position (0 = top, None = bottom). Defaults to bottom.
         """
-        new_card = deepcopy(card)
-        new_card.uuid = uuid4()
-        new_card.append_status("added_into_deck")
+        new_card = self._new_instance(card)
 
         if idx is None:
             self.deck_cards.append(new_card)
         else:
             self.deck_cards.insert(idx, new_card)
 
+    @staticmethod
+    def _new_instance(card: Card) -> Card:
+        """Clone a template into a fresh deck instance with its own UUID."""
+        new_card = card.clone()
+        new_card.uuid = uuid4()
+        new_card.append_status("added_into_deck")
+        return new_card
+
     def shuffle(self) -> None:
         """Shuffle the deck in-place and update relevant statuses."""
         self.append_status("shuffled")
+        # Discard directly: remove_status would copy every card's status set
         for c in self.deck_cards:
-            c.remove_status("observed")
+            c.status.discard("observed")
         shuffle(self.deck_cards)
 
     def add_into_deck(self, cards: List[Card]) -> None:
         """Randomly scatter cards throughout the deck (no final shuffle)."""
-        for card in cards:
-            pos = randrange(len(self.deck_cards) + 1)  # +1 allows bottom placement
-            self.add(card, pos)
+        if not cards:
+            return
+
+        # Same outcome as inserting one by one at random positions: the new
+        # cards land on uniformly chosen slots in random order, while the
+        # existing cards keep their relative order. Built in a single pass
+        # instead of one list.insert (and tail shift) per card.
+        new_cards = [self._new_instance(card) for card in cards]
+        shuffle(new_cards)
+        total = len(self.deck_cards) + len(new_cards)
+        new_slots = set(sample(range(total), len(new_cards)))
+
+        existing = iter(self.deck_cards)
+        incoming = iter(new_cards)
+        self.deck_cards[:] = [
+            next(incoming) if i in new_slots else next(existing)
+            for i in range(total)
+        ]
 
     def shuffle_into_deck(self, cards: List[Card]) -> None:
         """Randomly insert cards and then shuffle the whole deck."""
@@ -156,11 +198,35 @@ class Deck(StatusControllable):
 
     def remove(self, uuids: List[UUID]) -> None:
         """Remove cards identified by UUID. Removed cards get "removed_from_deck" status."""
-        for uuid in uuids:
-            card = next((c for c in self.deck_cards if c.uuid == uuid), None)
-            if card:
+        uuids_to_remove = set(uuids)
+        if not uuids_to_remove:
+            return
+
+        # One pass over the deck instead of a scan plus list.remove per UUID
+        kept_cards: List[Card] = []
+        for card in self.deck_cards:
+            if card.uuid in uuids_to_remove:
                 card.append_status("removed_from_deck")
-                self.deck_cards.remove(card)
+            else:
+                kept_cards.append(card)
+        self.deck_cards[:] = kept_cards
+
+    def clone(self) -> Deck:
+        """
+        Return an independent working copy of the deck.
+
+        Card order, UUIDs and statuses are preserved, but every card and status
+        set is a new object, so playing the copy never touches the original.
+        Replaces ``copy.deepcopy`` for per-game decks.
+        """
+        new_deck = self.__class__.__new__(self.__class__)
+        new_deck.status = self.status.copy()
+        new_deck.deck_cards = []
+        for card in self.deck_cards:
+            new_card = card.clone()
+            new_card.uuid = card.uuid
+            new_deck.deck_cards.append(new_card)
+        return new_deck
 
     # ------------------------------------------------------------------ #
     # Drawing & previewing
@@ -168,8 +234,10 @@ class Deck(StatusControllable):
 
     def pre_draw(self, num: int = 1) -> List[Card]:
         """Return the top *num* cards without altering the deck or applying statuses."""
-        n = min(num, len(self.deck_cards))
-        return [self.deck_cards[-i-1] for i in range(n)]
+        if num <= 0:
+            return []
+        # The top of the deck is the end of the list
+        return self.deck_cards[-num:][::-1]
 
     def draw(self, num: int = 1) -> List[Card]:
         """
@@ -209,9 +277,10 @@ class Deck(StatusControllable):
             self.shuffle()
             self.remove_status("observed")
 
+        uuids_in_deck = {c.uuid for c in self.deck_cards}
         uuids_to_remove: List[UUID] = []
         for card in cards:
-            if card in self.deck_cards:  # sanity check
+            if card.uuid in uuids_in_deck:  # sanity check
                 card.append_status("drawn_from_deck")
                 uuids_to_remove.append(card.uuid)
 
@@ -236,8 +305,8 @@ class Deck(StatusControllable):
 
         Behaviour when using a predicate:
             - Scans from the top down, collect cards that satisfy the predicate
-            - if fewer than *num* matches exist, randomly duplicate already-found cards
-              until the requested count is reached (mirrors certain game behaviours).
+            - if fewer than *num* matches exist, pad with random picks from the found
+              cards until the requested count is reached (mirrors certain game behaviours).
 
         Returns:
             List of observed Card references (not copies).
@@ -248,16 +317,18 @@ class Deck(StatusControllable):
             observed = self.pre_draw(num)
         else:
             observed: List[Card] = []
-            i = 0
-            while len(observed) < num and i < len(self.deck_cards):
-                card = self.deck_cards[-i-1]  # top-down
-                if predicate(card):
-                    observed.append(card)
-                i += 1
-
-            # Duplicate randomly if we didn't find enough
-            while len(observed) > 0 and len(observed) < num:
-                observed.append(sample(observed, 1)[0])
+            if num > 0:
+                for card in reversed(self.deck_cards):  # top-down
+                    if predicate(card):
+                        observed.append(card)
+                        if len(observed) == num:
+                            break
+
+            # Duplicate randomly if we didn't find enough. Picks come from the
+            # genuine matches only, so earlier duplicates don't skew later ones.
+            deficit = num - len(observed)
+            if observed and deficit > 0:
+                observed.extend(choices(observed, k=deficit))
 
         for card in observed:
             card.append_status("observed")
@@ -42,6 +42,7 @@ class StaticCardLikeBase:
             self.card_base: List[Card] = []
             self._by_name: dict[str, Card] = {}
             self._by_id: dict[str, Card] = {}
+            self._lower_names: List[str] = []  # parallel to card_base, for search()
             self.initialized = True
 
     # ------------------------------------------------------------------ #
@@ -67,6 +68,7 @@ class StaticCardLikeBase:
         self.card_base.append(card)
         self._by_name[card.name] = card
         self._by_id[card.id] = card
+        self._lower_names.append(card.name.lower())
 
     def register_many(self, cards: List[Card]) -> None:
         """Register multiple card templates at once."""
@@ -99,7 +101,10 @@ class StaticCardLikeBase:
         Example: StaticCardBase.search("dragon") → all cards with "dragon" in name.
         """
         lower_query = query.lower()
-        return [c for c in self.card_base if lower_query in c.name.lower()]
+        return [
+            card for card, lower_name in zip(self.card_base, self._lower_names)
+            if lower_query in lower_name
+        ]
 
     # ------------------------------------------------------------------ #
     #                           Utility                                   #
@@ -114,6 +119,7 @@ class StaticCardLikeBase:
         self.card_base.clear()
         self._by_name.clear()
         self._by_id.clear()
+        self._lower_names.clear()
 
     def __len__(self) -> int:
         return len(self.card_base)
@@ -1,58 +1,118 @@
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Iterator, Optional
+from functools import lru_cache
 from uuid import UUID, uuid4
-import re
 
-from backend.chess_related.piece import BasePiece, KingPiece, QueenPiece, BishopPiece, KnightPiece, RookPiece, PawnPiece, NonePiece
-from backend.chess_related.chess_utils import *
+from backend.chess_related.piece import BasePiece, KingPiece, QueenPiece, BishopPiece, KnightPiece, RookPiece, PawnPiece, NonePiece, NONE_PIECE
 
 from backend.misc.enums import PieceName
 
 from backend.controller_related.event_controller import EventHandler
+
+# Promotion targets never change, so build the lookup once instead of per move.
+# Accepts both piece names and the single-letter symbols the client sends ("q").
+PROMOTION_PIECES: Dict[str, type] = {
+    PieceName.BISHOP: BishopPiece,
+    PieceName.KNIGHT: KnightPiece,
+    PieceName.ROOK: RookPiece,
+    PieceName.QUEEN: QueenPiece,
+    "b": BishopPiece,
+    "n": KnightPiece,
+    "r": RookPiece,
+    "q": QueenPiece,
+}
+
+# Mapping of column indices to the corresponding back-row piece classes
+STANDARD_BACK_ROW: Tuple[type, ...] = (
+    RookPiece, KnightPiece, BishopPiece, QueenPiece,
+    KingPiece, BishopPiece, KnightPiece, RookPiece
+)
+
+def _parse_square_notation(square: str, board_dimension: int) -> Tuple[int, int]:
+    """
+    Full parser behind `Board.square_notation_to_array_index`.
+
+    Valid squares are answered from the precomputed `_square_index_table`,
+    so in practice this only runs to produce a descriptive error.
+    """
+    # Plain character checks; a regex is overkill for "<letter><digits>"
+    row_str = square[1:]
+    if not ("a" <= square[:1] <= "z" and row_str.isascii() and row_str.isdigit()):
+        raise ValueError(f"Invalid square notation: '{square}'")
+
+    column_char = square[0]
+
+    j = ord(column_char) - ord("a")
+    if not (0 <= j < board_dimension):
+        raise ValueError(f"Column out of range: '{column_char}'")
+
+    row = int(row_str)
+
+    if not (1 <= row <= board_dimension):
+        raise ValueError(f"Row out of range: {row}")
+
+    i = board_dimension - row
+    return i, j
+
+@lru_cache(maxsize=None)
+def _square_name_table(board_dimension: int) -> Tuple[Tuple[str, ...], ...]:
+    """Algebraic names for every (row, col) cell, built once per board size."""
+    return tuple(
+        tuple(f"{chr(ord('a') + j)}{board_dimension - i}" for j in range(board_dimension))
+        for i in range(board_dimension)
+    )
+
+@lru_cache(maxsize=None)
+def _square_index_table(board_dimension: int) -> Dict[str, Tuple[int, int]]:
+    """Reverse of `_square_name_table`: algebraic name -> (row, col)."""
+    return {
+        name: (i, j)
+        for i, row in enumerate(_square_name_table(board_dimension))
+        for j, name in enumerate(row)
+    }
+
 class Board:
     """
     Represents an 8x8 chess board with support for chess variants.
     Uses standard algebraic notation (e.g., 'e4', 'a1', 'h8').
     """
+    FILE_LABELS = "  a b c d e f g h"
 
     def __init__(self):
         self.BOARD_DIMENSION = 8
+        self.SQUARE_NAMES = _square_name_table(self.BOARD_DIMENSION)
+        self.SQUARE_INDICES = _square_index_table(self.BOARD_DIMENSION)
         self.board: List[List[Optional[BasePiece]]] = [
-            [NonePiece() for _ in range(8)] for _ in range(8)
+            [NONE_PIECE] * 8 for _ in range(8)
         ]
         self.card_event_handler: EventHandler = None
         
     def setup_standard_position(self):
-        # Mapping of column indices to the corresponding back-row piece classes
-        back_row_types = [
-            RookPiece, KnightPiece, BishopPiece, QueenPiece, 
-            KingPiece, BishopPiece, KnightPiece, RookPiece
-        ]
-
         for row in range(8):
+            # 3. Empty Rows: plain empty cells need no spawning point or UUID, so skip place_piece
+            if 2 <= row <= 5:
+                self.board[row] = [NONE_PIECE] * 8
+                continue
+            
             for col in range(8):
                 # Convert current loop coordinates to square notation (e.g., "a8")
                 square = self.array_index_to_square_notation(row, col)
                 
                 # 1. Black Back Row
                 if row == 0:
-                    piece_class = back_row_types[col]
+                    piece_class = STANDARD_BACK_ROW[col]
                     self.place_piece(piece_class("black"), square)
                 
                 # 2. Black Pawns
                 elif row == 1:
                     self.place_piece(PawnPiece("black"), square)
                 
-                # 3. Empty Rows
-                elif 2 <= row <= 5:
-                    self.place_piece(NonePiece(), square)
-                
                 # 4. White Pawns
                 elif row == 6:
                     self.place_piece(PawnPiece("white"), square)
                 
                 # 5. White Back Row
                 elif row == 7:
-                    piece_class = back_row_types[col]
+                    piece_class = STANDARD_BACK_ROW[col]
                     self.place_piece(piece_class("white"), square)
     
     def array_index_to_square_notation(self, i: int, j: int) -> str:
@@ -65,9 +125,7 @@ class Board:
         if not (0 <= i < self.BOARD_DIMENSION and 0 <= j < self.BOARD_DIMENSION):
             raise ValueError(f"Board indices out of range: ({i}, {j})")
 
-        column_char = chr(ord("a") + j)
-        row = self.BOARD_DIMENSION - i
-        return f"{column_char}{row}"
+        return self.SQUARE_NAMES[i][j]
     
     def square_notation_to_array_index(self, square: str) -> Tuple[int, int]:
         """
@@ -88,27 +146,11 @@ class Board:
             ValueError: if the notation is malformed or out of range.
         """
         square = square.strip().lower()
-
-        if not re.fullmatch(r"[a-z]\d+", square):
-            raise ValueError(f"Invalid square notation: '{square}'")
-
-        column_char = square[0]
-        row_str = square[1:]
-
-        j = ord(column_char) - ord("a")
-        if not (0 <= j < self.BOARD_DIMENSION):
-            raise ValueError(f"Column out of range: '{column_char}'")
-
-        try:
-            row = int(row_str)
-        except ValueError:
-            raise ValueError(f"Row is not a number: '{row_str}'") from None
-
-        if not (1 <= row <= self.BOARD_DIMENSION):
-            raise ValueError(f"Row out of range: {row}")
-
-        i = self.BOARD_DIMENSION - row
-        return i, j
+        index = self.SQUARE_INDICES.get(square)
+        if index is None:
+            # Not a board square; the parser raises the matching error
+            index = _parse_square_notation(square, self.BOARD_DIMENSION)
+        return index
 
     def get_piece_at_square(self, square: str) -> Optional[BasePiece]:
         """
@@ -137,6 +179,13 @@ class Board:
 
         return self.board[row_idx][column_idx]
     
+    def iter_pieces(self) -> Iterator[BasePiece]:
+        """Yield every piece on the board, skipping empty squares."""
+        for row in self.board:
+            for piece in row:
+                if piece and not isinstance(piece, NonePiece):
+                    yield piece
+
     def get_piece_by_uuid(self, uuid: UUID) -> Optional[BasePiece]:
         for row_index, row in enumerate(self.board):
             for col_index, element in enumerate(row):
@@ -146,38 +195,38 @@ class Board:
         # If the loop finishes without finding the element
         return None 
     
-    def get_square_of_piece(self, piece: BasePiece) -> Optional[str]:
+    def get_index_of_piece(self, piece: BasePiece) -> Optional[Tuple[int, int]]:
         """
         Searches the board for a piece with a matching UUID and 
-        returns its square notation (e.g., 'a1').
+        returns its array indices (row, col).
         """
         # 1. Skip search if the target is a NonePiece (since they don't have unique IDs)
         if isinstance(piece, NonePiece):
             return None
 
-        # 2. Iterate through the 8x8 board array
-        for i in range(8):
-            for j in range(8):
-                current_piece = self.board[i][j]
-                
+        # 2. Iterate through the board array
+        for i, row in enumerate(self.board):
+            for j, current_piece in enumerate(row):
                 # 3. Compare UUIDs to find the unique match
                 # We check if it's a NonePiece first to avoid AttributeErrors
                 if not isinstance(current_piece, NonePiece):
                     if current_piece.uuid == piece.uuid:
-                        # 4. Convert the array indices back to square notation
-                        return self.array_index_to_square_notation(i, j)
+                        return i, j
                         
         # Return None if the piece is not on the board
         return None
     
+    def get_square_of_piece(self, piece: BasePiece) -> Optional[str]:
+        """
+        Searches the board for a piece with a matching UUID and 
+        returns its square notation (e.g., 'a1').
+        """
+        index = self.get_index_of_piece(piece)
+        if index is None:
+            return None
+        return self.array_index_to_square_notation(*index)
+    
     def move_piece(self, from_sq: str, to_sq: str, en_passant_square: str = None, promotion: str = None) -> bool:
-        promotion_dict: Dict[PieceName, BasePiece] = {
-            PieceName.BISHOP: BishopPiece,
-            PieceName.KNIGHT: KnightPiece,
-            PieceName.ROOK: RookPiece,
-            PieceName.QUEEN: QueenPiece,
-        }
-        
         moving_piece = self.remove_piece(from_sq)
         if not moving_piece:
             return False
@@ -188,9 +237,10 @@ class Board:
             en_passant_piece = self.remove_piece(en_passant_square)
         
         if promotion:
-            promoted_to: BasePiece = promotion_dict.get(promotion, None)
+            promoted_to = PROMOTION_PIECES.get(promotion.lower(), None)
             if promoted_to:
-                moving_piece = promoted_to
+                # Keep the pawn's UUID and statuses, only its type changes
+                moving_piece = promoted_to.from_piece_type(moving_piece)
         
         self.place_piece(moving_piece, to_sq)
         
@@ -213,6 +263,10 @@ class Board:
         row_idx, column_idx = self.square_notation_to_array_index(square)
         self.board[row_idx][column_idx] = piece
         
+        # The shared empty-square sentinel must never pick up per-square identity
+        if piece is NONE_PIECE:
+            return True
+        
         if piece.spawning_point == "":
             piece.spawning_point = square
         
@@ -238,12 +292,12 @@ class Board:
             The removed piece, or None if square was empty or invalid
         """
         piece = self.get_piece_at_square(square)
-        if piece is None or piece is NonePiece():
+        if piece is None or piece is NONE_PIECE:
             return None
 
         row_idx, column_idx = self.square_notation_to_array_index(square)
         if 0 <= row_idx < 8 and 0 <= column_idx < 8:
-            self.board[row_idx][column_idx] = NonePiece()
+            self.board[row_idx][column_idx] = NONE_PIECE
         
         if self.card_event_handler:
             self.card_event_handler.dispatch_event("piece_placed", data={
@@ -256,20 +310,16 @@ class Board:
     def is_empty(self, square: str) -> bool:
         """Check if a square is empty."""
         piece = self.get_piece_at_square(square)
-        return piece is None or isinstance(piece, NonePiece)
+        return piece is None or piece is NONE_PIECE
 
     def __str__(self) -> str:
         """Pretty-print the board (useful for debugging)."""
-        lines = ["  a b c d e f g h"]
+        lines = [self.FILE_LABELS]
         for row in range(7, -1, -1):
-            this_row = [f"{row + 1}"]
-            for column in range(8):
-                piece = self.board[row][column]
-                symbol = "·" if isinstance(piece, NonePiece) else piece.name[0].upper()
-                this_row.append(symbol)
-            this_row.append(f"{row + 1}")
-            lines.append(" ".join(this_row))
-        lines.append("  a b c d e f g h")
+            rank = f"{row + 1}"
+            symbols = " ".join([piece.symbol for piece in self.board[row]])
+            lines.append(f"{rank} {symbols} {rank}")
+        lines.append(self.FILE_LABELS)
         return "\n".join(lines)
     
 if __name__ == "__main__":
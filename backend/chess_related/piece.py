@@ -16,14 +16,21 @@ Features:
 
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import List, Optional
+from copy import copy
+from functools import lru_cache
+from typing import Container, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from backend.chess_related.status_effect import StatusEffect
 from backend.misc.enums import PieceName, StatusCountdownMethod
 
 
+@lru_cache(maxsize=None)
+def _move_rule_values(move_rule: Tuple[PieceName, ...]) -> Tuple[str, ...]:
+    """String values for a move-rule combination, computed once per combination."""
+    return tuple(p.value for p in move_rule)
+
+
 class BasePiece:
     """
     Base class for all game pieces in chess variants.
@@ -34,11 +41,18 @@ class BasePiece:
     Attributes:
         name (str): Lowercase piece name (e.g., "queen")
         move_rule (List[str]): Primitive movement types this piece uses
-        status (List[StatusEffect]): Active status effects with metadata
+        status (List[StatusEffect]): Active status effects with metadata, in the
+            order they were applied (read-only view of a name-keyed dict)
         is_capturable (bool): Can be captured
         is_lose_on_capture (bool): Game ends if captured (e.g., king)
         is_removable (bool): Can be permanently removed
+        symbol (str): One-character board diagram glyph (class attribute)
     """
+    __slots__ = (
+        "_name", "_move_rule", "color", "_status", "spawning_point",
+        "is_capturable", "is_lose_on_capture", "is_removable", "uuid",
+    )
+    symbol: str = "?"
 
     def __init__(
         self,
@@ -52,9 +66,11 @@ class BasePiece:
         is_removable: bool = True
     ) -> None:
         self._name = piece_name.value
-        self._move_rule = [p.value for p in move_rule]
+        # Cards append to / remove from move_rule at runtime, so each piece
+        # needs its own list; only the enum-to-str conversion is shared.
+        self._move_rule = list(_move_rule_values(tuple(move_rule)))
         self.color = color
-        self.status: List[StatusEffect] = []
+        self._status: Dict[str, StatusEffect] = {}
         self.spawning_point = spawning_point
         self.is_capturable = is_capturable
         self.is_lose_on_capture = is_lose_on_capture
@@ -71,6 +87,11 @@ class BasePiece:
         """List of primitive movement types."""
         return self._move_rule
 
+    @property
+    def status(self) -> List[StatusEffect]:
+        """Active status effects, oldest first."""
+        return list(self._status.values())
+
     # ────────────────────────────── Status Management ────────────────────────────── #
 
     def add_status(self, status: StatusEffect) -> StatusEffect:
@@ -81,20 +102,17 @@ class BasePiece:
             StatusEffect: The created or updated effect
         """
         name = status.name
-        stack = status.stack
+        existing = self._status.get(name)
+        if existing is None:
+            self._status[name] = status
+            return status
+
+        existing.stack += status.stack
         duration = status.duration
-        countdown_method = status.countdown_method
-        
-        existing = self.get_status_effect(name)
-        if existing:
-            existing.stack += stack
-            if duration > existing.duration:
-                existing.duration = duration
-                existing.countdown_method = countdown_method
-            return existing
-
-        self.status.append(status)
-        return status
+        if duration > existing.duration:
+            existing.duration = duration
+            existing.countdown_method = status.countdown_method
+        return existing
 
     def remove_status(self, name: str, stacks: int = -1) -> int:
         """
@@ -107,12 +125,12 @@ class BasePiece:
         Returns:
             int: Remaining stacks (-1 if fully removed)
         """
-        effect = self.get_status_effect(name)
+        effect = self._status.get(name)
         if not effect:
             return 0
 
         if stacks == -1 or stacks >= effect.stack:
-            self.status = [s for s in self.status if s.name != name]
+            del self._status[name]
             return 0
 
         effect.stack -= stacks
@@ -120,19 +138,32 @@ class BasePiece:
 
     def has_status(self, name: str) -> bool:
         """Check if piece has a status (any stack count)."""
-        return any(s.name == name for s in self.status)
+        return name in self._status
 
     def get_status_effect(self, name: str) -> Optional[StatusEffect]:
         """Get the StatusEffect object by name, if present."""
-        for effect in self.status:
-            if effect.name == name:
-                return effect
-        return None
+        return self._status.get(name)
 
     def get_status_stack(self, name: str) -> int:
         """Get current stack count of a status (0 if absent)."""
         effect = self.get_status_effect(name)
         return effect.stack if effect else 0
+
+    def tick_statuses(self, countdown_methods: Container[StatusCountdownMethod]) -> List[str]:
+        """
+        Count down every status whose countdown method is in ``countdown_methods``
+        by one turn and drop the ones that expire, in a single pass.
+
+        Returns:
+            List[str]: Names of the statuses that expired and were removed
+        """
+        expired = [
+            name for name, effect in self._status.items()
+            if effect.countdown_method in countdown_methods and effect.decrement_duration(1)
+        ]
+        for name in expired:
+            del self._status[name]
+        return expired
     
     # ────────────────────────────── Change PieceType ────────────────────────────── #
     
@@ -158,16 +189,17 @@ class BasePiece:
                 f"got {type(piece).__name__}"
             )
 
-        preserved_state = deepcopy(piece.__dict__)
-        preserved_state.pop("_name", None)
-        preserved_state.pop("_move_rule", None)
-        
-        color = preserved_state.get("color", getattr(piece, "color", None))
+        color = getattr(piece, "color", None)
         if color is None:
             raise ValueError("Source piece must define a color before conversion.")
 
         new_piece = cls(color)
-        new_piece.__dict__.update(preserved_state)
+        # Name and move rule come from the new type; carry everything else over.
+        # Only the status list is mutated per piece; everything else is immutable
+        # or replaced wholesale, so a shallow copy is enough.
+        for attr in _PRESERVED_PIECE_STATE:
+            setattr(new_piece, attr, getattr(piece, attr))
+        new_piece._status = {name: copy(effect) for name, effect in piece._status.items()}
         return new_piece
 
     # ────────────────────────────── Representation ────────────────────────────── #
@@ -186,14 +218,14 @@ class BasePiece:
             "  Status effects:"
         ]
 
-        if not self.status:
+        if not self._status:
             lines.append("    None")
         else:
-            for s in self.status:
+            on_turn_end = StatusCountdownMethod.ON_TURN_END
+            for s in self._status.values():
                 duration_str = f" ({s.duration} turns)" if s.duration > 0 else " (permanent)"
-                lines.append(f"    • {s.name} [x{s.stack}]{duration_str}")
-                if s.countdown_method != StatusCountdownMethod.ON_TURN_END:
-                    lines[-1] += f" [{s.countdown_method.value}]"
+                countdown_str = "" if s.countdown_method == on_turn_end else f" [{s.countdown_method.value}]"
+                lines.append(f"    • {s.name} [x{s.stack}]{duration_str}{countdown_str}")
 
         lines += [
             f"  Capturable: {self.is_capturable}",
@@ -204,39 +236,87 @@ class BasePiece:
         return "\n".join(lines)
 
 
+# Per-piece state that survives a type change (see BasePiece.from_piece_type)
+_PRESERVED_PIECE_STATE = tuple(
+    attr for attr in BasePiece.__slots__ if attr not in ("_name", "_move_rule")
+)
+
+
 # ────────────────────────────────────────────────────────────────────────────── #
 # Standard Chess Pieces
 # ────────────────────────────────────────────────────────────────────────────── #
 
 class KingPiece(BasePiece):
     """King — loss condition piece."""
+    __slots__ = ()
+    symbol = "K"
+
     def __init__(self, color) -> None:
         super().__init__(PieceName.KING, [PieceName.KING], color, is_lose_on_capture=True, is_removable=False)
 
 class QueenPiece(BasePiece):
     """Queen = Rook + Bishop."""
+    __slots__ = ()
+    symbol = "Q"
+
     def __init__(self, color) -> None:
         super().__init__(PieceName.QUEEN, [PieceName.BISHOP, PieceName.ROOK], color)
 
 class BishopPiece(BasePiece):
+    __slots__ = ()
+    symbol = "B"
+
     def __init__(self, color) -> None:
         super().__init__(PieceName.BISHOP, [PieceName.BISHOP], color)
 
 class KnightPiece(BasePiece):
+    __slots__ = ()
+    symbol = "N"
+
     def __init__(self, color) -> None:
         super().__init__(PieceName.KNIGHT, [PieceName.KNIGHT], color)
 
 class RookPiece(BasePiece):
+    __slots__ = ()
+    symbol = "R"
+
     def __init__(self, color) -> None:
         super().__init__(PieceName.ROOK, [PieceName.ROOK], color)
 
 class PawnPiece(BasePiece):
+    __slots__ = ()
+    symbol = "P"
+
     def __init__(self, color) -> None:
         super().__init__(PieceName.PAWN, [PieceName.PAWN], color)
 
 class NonePiece(BasePiece):
+    """
+    Empty-square sentinel.
+
+    There is only ever one instance (``NONE_PIECE``); calling ``NonePiece()``
+    returns it, so ``piece is NONE_PIECE`` is a valid emptiness test.
+    """
+    __slots__ = ()
+    symbol = "·"
+    _instance: Optional["NonePiece"] = None
+
+    def __new__(cls) -> "NonePiece":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self):
-        super().__init__(PieceName.UNKNOWN, [], "none")
+        if not hasattr(self, "_name"):
+            super().__init__(PieceName.UNKNOWN, [], "none")
+
+    def __copy__(self) -> "NonePiece":
+        return self
+
+    def __deepcopy__(self, memo) -> "NonePiece":
+        return self
+
+NONE_PIECE = NonePiece()
 
 # ────────────────────────────────────────────────────────────────────────────── #
 # Demo / Test
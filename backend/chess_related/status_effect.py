@@ -1,3 +1,5 @@
+import sys
+
 from misc.enums import StatusCountdownMethod
 
 class StatusEffect:
@@ -14,6 +16,8 @@ class StatusEffect:
         countdown_method (StatusCountdownMethod): When the duration decreases
     """
 
+    __slots__ = ("name", "stack", "duration", "countdown_method")
+
     def __init__(
         self,
         name: str,
@@ -30,7 +34,8 @@ class StatusEffect:
             duration: Turns remaining (-1 = infinite)
             countdown_method: When to decrement duration
         """
-        self.name = name
+        # Interned so name comparisons/dict probes usually hit the identity fast path
+        self.name = sys.intern(name)
         self.stack = max(1, stack)  # Ensure at least 1
         self.duration = duration
         self.countdown_method = countdown_method
@@ -6,13 +6,24 @@ from card_related.static_card_base import StaticCardBase, StaticSystemBase
 
 from chess_related.board import Board
 from chess_related.piece import BasePiece, KingPiece, QueenPiece, BishopPiece, KnightPiece, RookPiece, PawnPiece, NonePiece
-from chess_related.chess_utils import *
 
 from player_related.player import Player
 
 
 from controller_related.event_controller import EventHandler
 
+# Squares on every column, row and diagonal, built once instead of per filter call
+COLUMN_COORDS = tuple(tuple((row, col) for row in range(8)) for col in range(8))
+ROW_COORDS = tuple(tuple((row, col) for col in range(8)) for row in range(8))
+WHITE_DIAGONAL_COORDS = {
+    diff: tuple((r, r - diff) for r in range(8) if 0 <= r - diff < 8)
+    for diff in range(-7, 8)
+}
+BLACK_DIAGONAL_COORDS = {
+    total: tuple((r, total - r) for r in range(8) if 0 <= total - r < 8)
+    for total in range(15)
+}
+
 class StaticFilterBase:
     """
     A container for static filtering methods.
@@ -25,8 +36,7 @@ class StaticFilterBase:
         if pos is None:
             return False
         _, col = pos
-        coords = [(row, col) for row in range(8)]
-        return StaticFilterBase._is_only_piece_at_coords(piece, board, coords)
+        return StaticFilterBase._is_only_piece_at_coords(piece, board, COLUMN_COORDS[col])
 
     @staticmethod
     def only_of_row(piece: BasePiece, board: Board) -> bool:
@@ -34,8 +44,7 @@ class StaticFilterBase:
         if pos is None:
             return False
         row, _ = pos
-        coords = [(row, col) for col in range(8)]
-        return StaticFilterBase._is_only_piece_at_coords(piece, board, coords)
+        return StaticFilterBase._is_only_piece_at_coords(piece, board, ROW_COORDS[row])
 
     @staticmethod
     def only_of_all_diagonal(piece: BasePiece, board: Board) -> bool:
@@ -50,13 +59,7 @@ class StaticFilterBase:
         if pos is None:
             return False
         row, col = pos
-        diff = row - col
-        coords = []
-        for r in range(8):
-            c = r - diff
-            if 0 <= c < 8:
-                coords.append((r, c))
-        return StaticFilterBase._is_only_piece_at_coords(piece, board, coords)
+        return StaticFilterBase._is_only_piece_at_coords(piece, board, WHITE_DIAGONAL_COORDS[row - col])
 
     @staticmethod
     def only_of_black_diagonal(piece: BasePiece, board: Board) -> bool:
@@ -64,43 +67,28 @@ class StaticFilterBase:
         if pos is None:
             return False
         row, col = pos
-        total = row + col
-        coords = []
-        for r in range(8):
-            c = total - r
-            if 0 <= c < 8:
-                coords.append((r, c))
-        return StaticFilterBase._is_only_piece_at_coords(piece, board, coords)
+        return StaticFilterBase._is_only_piece_at_coords(piece, board, BLACK_DIAGONAL_COORDS[row + col])
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
     @staticmethod
     def _piece_position(piece: BasePiece, board: Board) -> tuple[int, int] | None:
-        square = board.get_square_of_piece(piece)
-        if not square:
-            return None
-        return board.square_notation_to_array_index(square)
+        return board.get_index_of_piece(piece)
 
     @staticmethod
     def _is_only_piece_at_coords(
         piece: BasePiece,
         board: Board,
-        coords: list[tuple[int, int]],
+        coords: Iterable[tuple[int, int]],
     ) -> bool:
-        pieces = StaticFilterBase._piece_at_coords(piece, board, coords)
-        return len(pieces) == 1 and pieces[0] == piece
-
-    @staticmethod
-    def _piece_at_coords(
-        piece: BasePiece,
-        board: Board,
-        coords: list[tuple[int, int]],
-    ) -> list[BasePiece]:
-        piece_found = []
+        # Stop at the first other occupant instead of collecting every piece on the line
+        found = False
         for r, c in coords:
             that_piece = board.board[r][c]
-            if not isinstance(that_piece, NonePiece):
-                piece_found.append(that_piece)
-
-        return piece_found
\ No newline at end of file
+            if isinstance(that_piece, NonePiece):
+                continue
+            if that_piece is not piece:
+                return False
+            found = True
+        return found
\ No newline at end of file
@@ -5,7 +5,6 @@ Model class representing a player in the card game system.
 Part of the MVC architecture (Model layer only).
 """
 
-from copy import deepcopy
 from typing import List, Dict, Any
 
 from backend.card_related.card_driver import Deck, Card
@@ -32,6 +31,11 @@ class Player:
                                 (counters, expiration turns, etc.).
     """
 
+    __slots__ = (
+        "username", "sid", "system", "prestige", "original_deck",
+        "deck", "hand", "graveyard", "status",
+    )
+
     def __init__(
         self,
         username: str,
@@ -55,7 +59,7 @@ class Player:
         self.prestige: int = 0
 
         self.original_deck = deck
-        self.deck: Deck = deepcopy(deck)
+        self.deck: Deck = deck.clone()
 
         self.hand: List[Card] = []
         self.graveyard: List[Card] = []
@@ -74,7 +78,7 @@ class Player:
         """
         self.hand.clear()
         self.graveyard.clear()
-        self.deck = deepcopy(self.original_deck)
+        self.deck = self.original_deck.clone()
         self.status.clear()
 
     def get_state(self) -> Dict[str, Any]:
@@ -90,7 +94,7 @@ class Player:
             "system": self.system,
             "sid": self.sid,
             "hand_size": len(self.hand),
-            "deck_size": len(self.deck.cards),
+            "deck_size": len(self.deck.deck_cards),
             "graveyard_size": len(self.graveyard),
             "status": self.status,                    # visible status effects
         }
@@ -1,7 +1,8 @@
 from copy import deepcopy
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
-from typing import Type, List, Dict, Union, Callable, Any, Optional
+from typing import Type, List, Dict, Union, Callable, Any, Optional, Tuple
 from types import SimpleNamespace
 from uuid import UUID
 import logging
@@ -14,7 +15,6 @@ from backend.card_related.static_card_base import StaticCardBase, StaticSystemBa
 
 from backend.chess_related.board import Board
 from backend.chess_related.piece import BasePiece, KingPiece, QueenPiece, BishopPiece, KnightPiece, RookPiece, PawnPiece, NonePiece
-from backend.chess_related.chess_utils import *
 from backend.chess_related.status_effect import StatusEffect
 
 from backend.controller_related.event_controller import EventHandler
@@ -24,6 +24,30 @@ from backend.misc.enums import StatusCountdownMethod, PieceName
 
 from backend.player_related.player import Player
 
+logger = logging.getLogger(__name__)
+
+# Effect scripts never change while the server runs, so resolve each one once
+# per process instead of once per game (or once per card played).
+@lru_cache(maxsize=None)
+def find_effect_class(package: str, class_prefix: str, effect_id: str) -> Optional[type]:
+    """Return `<class_prefix><effect_id>` from `<package>/<effect_id>.py`, or None if there is no script."""
+    if not Path(f"{package}/{effect_id}.py").exists():
+        return None
+    return getattr(import_module(f"{package}.{effect_id}"), f"{class_prefix}{effect_id}")
+
+@lru_cache(maxsize=None)
+def import_card_class(card_class_name: str) -> type:
+    """Import and return the card script class `cards.<card_class_name>`."""
+    return getattr(import_module(f"cards.{card_class_name}"), card_class_name)
+
+@lru_cache(maxsize=None)
+def squares_between(fr: int, fc: int, tr: int, tc: int) -> Tuple[Tuple[int, int], ...]:
+    """Grid cells strictly between two squares on one line; each pair is computed only once."""
+    dr = (tr - fr) // max(1, abs(tr - fr))  # Step direction row
+    dc = (tc - fc) // max(1, abs(tc - fc))  # Step direction col
+    steps = max(abs(tr - fr), abs(tc - fc))
+    return tuple((fr + dr * i, fc + dc * i) for i in range(1, steps))
+
 class GameController:
     
     def __init__(
@@ -36,6 +60,10 @@ class GameController:
         self.room = room
         self.PLAYER_COLOR_WHITE = "white"
         self.PLAYER_COLOR_BLACK = "black"
+        self.OPPONENT_COLOR = {
+            self.PLAYER_COLOR_WHITE: self.PLAYER_COLOR_BLACK,
+            self.PLAYER_COLOR_BLACK: self.PLAYER_COLOR_WHITE
+        }
         self.SUPPORTED_CARD_AREA = ["deck", "hand", "graveyard"]
 
         self.board = board
@@ -51,17 +79,17 @@ class GameController:
         card_base = StaticCardBase.instance()
         self.all_card_ids = [card.id for card in card_base.all_cards()]
         self.card_classes = {
-            cid: getattr(import_module(f"cards.{cid}"), f"Card{cid}") 
-            for cid in self.all_card_ids 
-            if Path(f"cards/{cid}.py").exists()
+            cid: card_class
+            for cid in self.all_card_ids
+            if (card_class := find_effect_class("cards", "Card", cid))
         }
         
         system_base = StaticSystemBase.instance()
         self.all_system_ids = [system.id for system in system_base.all_cards()]
         self.system_classes = {
-            sid: getattr(import_module(f"systems.{sid}"), f"System{sid}") 
-            for sid in self.all_system_ids 
-            if Path(f"systems/{sid}.py").exists()
+            sid: system_class
+            for sid in self.all_system_ids
+            if (system_class := find_effect_class("systems", "System", sid))
         }
 
         # For blocking selection (synchronous-like wait)
@@ -76,7 +104,7 @@ class GameController:
     
     def resolve_player_colors(self, player_color: str) -> List[str]:
         friendly = self.current_player
-        enemy = self.PLAYER_COLOR_BLACK if friendly == self.PLAYER_COLOR_WHITE else self.PLAYER_COLOR_WHITE
+        enemy = self.OPPONENT_COLOR[friendly]
         
         mapping = {
             "all": [friendly, enemy],
@@ -115,7 +143,7 @@ class GameController:
         # --- resolve which players to inspect -------------------------------------
         player_filter = filters.get("player")
         target_players: List[Player] = []
-        enemy_player = self.PLAYER_COLOR_BLACK if self.current_player == self.PLAYER_COLOR_WHITE else self.PLAYER_COLOR_WHITE
+        enemy_player = self.OPPONENT_COLOR[self.current_player]
 
         if player_filter in (None, "any"):
             target_players = list(self.players.values())
@@ -183,7 +211,7 @@ class GameController:
         min_required = predicate.get("min")
         required = predicate.get("required", False)
 
-        if min_required is not None and min_required > 0 and len(matches) == 0:
+        if min_required is not None and min_required > 0 and not matches:
             if required:
                 raise ValueError(
                     f"Card predicate requires at least {min_required} matches."
@@ -221,7 +249,7 @@ class GameController:
                     continue
                 if piece_type_filter and piece.__class__.__name__ not in piece_type_filter:
                     continue
-                if len(custom_filters) > 0 and not self.pass_custom_filters(piece, custom_filters):
+                if custom_filters and not self.pass_custom_filters(piece, custom_filters):
                     continue
 
                 square = self.board.array_index_to_square_notation(i, j)
@@ -336,8 +364,7 @@ class GameController:
         # Dynamically load card class
         card_class_name = f"Card{card_prototype.id}"
         try:
-            card_module = import_module(f"cards.{card_class_name}")
-            card_class = getattr(card_module, card_class_name)
+            card_class = import_card_class(card_class_name)
         except (ImportError, AttributeError):
             print(f"[ERROR] Card {card_prototype.id} class not found")
             return
@@ -362,8 +389,13 @@ class GameController:
             'win': False
         }
 
+        # Parse both squares once; every check below works on grid indices
+        from_row, from_col = self.board.square_notation_to_array_index(from_where)
+        to_row, to_col = self.board.square_notation_to_array_index(to_where)
+        squares = self.board.board
+
         # 1. Get the piece from the board
-        piece = self.board.get_piece_at_square(from_where)
+        piece = squares[from_row][from_col]
         print(f"Piece: {piece.__class__.__name__}, Color: {piece.color}")
         if not piece or piece.color != self.current_player:
             print("not passing piece color check")
@@ -373,13 +405,8 @@ class GameController:
             print("not passing movable piece check")
             return result
 
-        # 2. Check if move is possible under current moving rules
-        if not self.is_valid_move(piece, from_where, to_where):
-            print("not passing piece valid move check")
-            return result
-
-        # 3. Check for capture
-        target_piece = self.board.get_piece_at_square(to_where)
+        # 2. Check for capture (cheap, so reject own/uncapturable targets before walking move rules)
+        target_piece = squares[to_row][to_col]
         captured = False
         if target_piece and not isinstance(target_piece, NonePiece):
             if target_piece.color == self.current_player or not target_piece.is_capturable:
@@ -388,6 +415,11 @@ class GameController:
                 return result
             captured = True
 
+        # 3. Check if move is possible under current moving rules
+        if not self.is_valid_move_by_index(piece, from_row, from_col, to_row, to_col):
+            print("not passing piece valid move check")
+            return result
+
         # 4. Success — prepare result
         result["success"] = True
         
@@ -415,18 +447,19 @@ class GameController:
             "promotion": promotion
         })
         
-        # Handle promotion if applicable
-        if piece._name == PieceName.PAWN and self.is_promotion_rank(to_where, piece.color) and promotion != "none":
-            self.board.move_piece(from_where, to_where, en_passant_square, promotion=promotion if promotion != "none" else None)
+        # Handle promotion if applicable (a single board move either way)
+        promote_to = None
+        if piece._name == PieceName.PAWN and promotion not in (None, "none") and self.is_promotion_rank(to_where, piece.color):
+            promote_to = promotion
         
-        self.board.move_piece(from_where, to_where, en_passant_square)
+        self.board.move_piece(from_where, to_where, en_passant_square, promotion=promote_to)
+        # Promotion swaps in a new piece object (carrying the pawn's statuses),
+        # so clean up whatever now stands on the target square
+        moved_piece = squares[to_row][to_col]
         
-        for row in self.board.board:
-            for that_piece in row:
-                if not that_piece or isinstance(piece, NonePiece):
-                    continue
-                self.remove_piece_status(that_piece, "movable", stack=-1)
-        self.remove_piece_status(piece, "card_given_movable", stack=-1)
+        for that_piece in self.board.iter_pieces():
+            self.remove_piece_status(that_piece, "movable", stack=-1)
+        self.remove_piece_status(moved_piece, "card_given_movable", stack=-1)
 
         return result
 
@@ -444,7 +477,10 @@ class GameController:
         """
         from_row, from_col = self.board.square_notation_to_array_index(from_square)
         to_row, to_col = self.board.square_notation_to_array_index(to_square)
+        return self.is_valid_move_by_index(piece, from_row, from_col, to_row, to_col)
 
+    def is_valid_move_by_index(self, piece: BasePiece, from_row: int, from_col: int, to_row: int, to_col: int) -> bool:
+        """Same as `is_valid_move`, for callers that already hold array indices."""
         for rule in piece._move_rule:
             if self.check_move_by_rule(rule, from_row, from_col, to_row, to_col, piece.color):
                 return True
@@ -475,11 +511,10 @@ class GameController:
         dr = tr - fr
         dc = tc - fc
         
-        print(f"""
-Checking rule \"{color} {rule}\" 
-[row] from {fr} to {tr} dr {dr}
-[col] from {fc} to {tc} dr {dc}
-""")
+        logger.debug(
+            "Checking rule \"%s %s\" [row] from %d to %d dr %d [col] from %d to %d dc %d",
+            color, rule, fr, tr, dr, fc, tc, dc,
+        )
 
         if rule == PieceName.BISHOP:
             if abs(dr) != abs(dc) or dr == 0: return False
@@ -497,33 +532,25 @@ Checking rule \"{color} {rule}\"
 
         elif rule == PieceName.PAWN:
             direction = -1 if color == self.PLAYER_COLOR_WHITE else 1
+            # Indices are already validated, so read the grid directly and only
+            # look up the squares this particular pawn move actually depends on.
+            squares = self.board.board
+            target_piece = squares[tr][tc]
             if dc == 0:  # forward pushes
-                target_piece = self.board.get_piece_at_square(
-                    self.board.array_index_to_square_notation(tr, tc)
-                )
-                target_mid_piece = self.board.get_piece_at_square(
-                    self.board.array_index_to_square_notation(fr + direction, fc)
-                )
-                if (dr == direction and isinstance(target_piece, NonePiece)):
+                if not isinstance(target_piece, NonePiece):
+                    return False
+                if dr == direction:
                     return True
-                if (
+                return (
                     dr == 2 * direction
                     and fr == (6 if color == self.PLAYER_COLOR_WHITE else 1)
-                    and isinstance(target_mid_piece, NonePiece)
-                    and isinstance(target_piece, NonePiece)
-                ):
-                    return True
+                    and isinstance(squares[fr + direction][fc], NonePiece)
+                )
 
             elif abs(dc) == 1 and dr == direction:
-                target_square = self.board.array_index_to_square_notation(tr, tc)
-                target_piece = self.board.get_piece_at_square(target_square)
-                if target_piece:
+                if not isinstance(target_piece, NonePiece):
                     return True
-                else:
-                    target_en_passant_square = self.board.array_index_to_square_notation(fr, tc)
-                    target_en_passant_piece = self.board.get_piece_at_square(target_en_passant_square)
-                    if target_en_passant_piece.has_status("en_passant"):
-                        return True
+                return squares[fr][tc].has_status("en_passant")
 
             return False
 
@@ -541,20 +568,15 @@ Checking rule \"{color} {rule}\"
         """
         Check if path between squares is empty (for sliding pieces)
         """
-        dr = (tr - fr) // max(1, abs(tr - fr))  # Step direction row
-        dc = (tc - fc) // max(1, abs(tc - fc))  # Step direction col
+        squares = self.board.board
 
-        cr, cc = fr + dr, fc + dc
+        logger.debug("Checking if path clear...")
 
-        print("Checking if path clear...")
-        
-        while (cr, cc) != (tr, tc):
-            target_piece = self.board.get_piece_at_square(self.board.array_index_to_square_notation(cr, cc))
+        for cr, cc in squares_between(fr, fc, tr, tc):
+            target_piece = squares[cr][cc]
             if not isinstance(target_piece, NonePiece):
-                print(f"Path is not clear at {self.board.array_index_to_square_notation(cr, cc)} with Piece {target_piece}")
+                logger.debug("Path is not clear at (%d, %d) with Piece %s", cr, cc, target_piece)
                 return False
-            cr += dr
-            cc += dc
         return True
 
     def is_promotion_rank(self, square: str, color: str) -> bool:
@@ -585,11 +607,8 @@ Checking rule \"{color} {rule}\"
         self.turn_start()
 
     def turn_start(self):
-        for row in self.board.board:
-            for piece in row:
-                if not piece or isinstance(piece, NonePiece):
-                    continue
-                self.add_piece_status(piece, StatusEffect("movable"))
+        for piece in self.board.iter_pieces():
+            self.add_piece_status(piece, StatusEffect("movable"))
                 
         self.card_event_handler.dispatch_event("turn_start", data={})
 
@@ -760,24 +779,14 @@ Checking rule \"{color} {rule}\"
         for tag_key in self.once_per_turn_tags.keys():
             self.once_per_turn_tags[tag_key].clear()
 
-        for row in self.board.board:
-            for piece in row:
-                if not piece or isinstance(piece, NonePiece):
-                    continue
+        current_player = self.current_player
+        # ON_TURN_END only ticks for the side that just moved; ON_BOTH_TURN_END ticks for everyone
+        moving_side_methods = (StatusCountdownMethod.ON_TURN_END, StatusCountdownMethod.ON_BOTH_TURN_END)
+        other_side_methods = (StatusCountdownMethod.ON_BOTH_TURN_END,)
+        for piece in self.board.iter_pieces():
+            countdown_methods = moving_side_methods if piece.color == current_player else other_side_methods
+            if piece.tick_statuses(countdown_methods):
+                # Only expiry can change the status-bound flags
+                self.check_property_bound_with_status(piece)
 
-                for status in list(piece.status):
-                    should_tick = (
-                        status.countdown_method == StatusCountdownMethod.ON_TURN_END
-                        and piece.color == self.current_player
-                    ) or (
-                        status.countdown_method == StatusCountdownMethod.ON_BOTH_TURN_END
-                    )
-
-                    if should_tick:
-                        self.remove_piece_status(piece, status.name, duration=1)
-
-        self.current_player = (
-            self.PLAYER_COLOR_WHITE
-            if self.current_player == self.PLAYER_COLOR_BLACK
-            else self.PLAYER_COLOR_BLACK
-        )
+        self.current_player = self.OPPONENT_COLOR[self.current_player]
@@ -1,7 +1,9 @@
-from typing import List, Dict, Callable
-import json
+from typing import Dict, Callable
+from functools import lru_cache
 import os
-from xml.etree.ElementTree import parse, ParseError, Element
+
+import orjson
+from xml.etree.ElementTree import iterparse, ParseError
 
 LOCALIZATION_PATH = "database/localization"
 
@@ -15,62 +17,60 @@ def get_all_data(get_function: Callable[[], Dict[str, Dict[str, str]]], language
     
     return data
 
+@lru_cache(maxsize=1)
 def get_all_localization() -> Dict[str, Dict[str, str]]:
+    # Parsed once per process; shared, so callers must not mutate the result
     xml_dict: Dict[str, Dict[str, str]] = {}
-    for root, dirs, files in os.walk(LOCALIZATION_PATH):
-        for file in files:
-            if file.endswith('.xml'):
-                file_language, ext = os.path.splitext(file)
-                file_path = os.path.join(root, file)
-                try:
-                    tree = parse(file_path)
-                    et_root = tree.getroot()
-                    localized_texts = et_root.find("LocalizedText")
-                    replaced_tags = format_xml_element_into_dict(localized_texts.findall("Replace"))
-                    xml_dict[file_language] = replaced_tags
-                except ParseError:
-                    xml_dict[file_language] = None
+    # One file per language directly under LOCALIZATION_PATH (e.g. en.xml)
+    with os.scandir(LOCALIZATION_PATH) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.xml') or not entry.is_file():
+                continue
+            file_language = entry.name[:-4]
+            try:
+                xml_dict[file_language] = read_replace_tags(entry.path)
+            except ParseError:
+                xml_dict[file_language] = None
     return xml_dict
 
-def format_xml_element_into_dict(replace_tags: List[Element]) -> Dict[str, str]:
+def read_replace_tags(file_path: str) -> Dict[str, str]:
+    """Stream <Replace Tag="..."><Text>...</Text></Replace> entries without keeping the whole tree."""
     result = {}
-    for replace_xml_element in replace_tags:
-        tag = replace_xml_element.get("Tag")
-        text = replace_xml_element.find("Text").text
-        text = text.strip()
-        result[tag] = text
+    for _, element in iterparse(file_path, events=("end",)):
+        if element.tag == "Replace":
+            text_element = element.find("Text")
+            if text_element is not None and text_element.text is not None:
+                result[element.get("Tag")] = text_element.text.strip()
+            element.clear()
     return result
 
 def get_skills() -> Dict[str, Dict[str, str]]:
     try:
-        with open('database/json/skills.json') as f:
-            data = json.load(f)
-            return data
+        with open('database/json/skills.json', 'rb') as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         print("Error: 'skills.json' not found.")
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print("Error: Invalid JSON format in 'skills.json'.")
     return {}
 
 def get_cards() -> Dict[str, Dict[str, str]]:
     try:
-        with open('database/json/cardbase.json') as f:
-            data = json.load(f)
-            return data
+        with open('database/json/cardbase.json', 'rb') as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         print("Error: 'cardbase.json' not found.")
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print("Error: Invalid JSON format in 'cardbase.json'.")
     return {}
 
 def get_systems() -> Dict[str, Dict[str, str]]:
     try:
-        with open('database/json/systembase.json') as f:
-            data = json.load(f)
-            return data
+        with open('database/json/systembase.json', 'rb') as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         print("Error: 'systembase.json' not found.")
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print("Error: Invalid JSON format in 'systembase.json'.")
     return {}
 
@@ -80,12 +80,13 @@ def replace_tags_with_localized_text(
         attr: str, 
         replacement_tags: Dict[str, str]
     ) -> str:
-    target_str = dict[key][attr]
-    if target_str.startswith("<"):
-        skill_tag = target_str[1:-1]
-        if skill_tag in replacement_tags:
-            dict[key][attr] = replacement_tags[skill_tag]
-            return replacement_tags[skill_tag]
+    row = dict[key]
+    target_str = row[attr]
+    if target_str and target_str[0] == "<" and target_str[-1] == ">":
+        localized = replacement_tags.get(target_str[1:-1])
+        if localized is not None:
+            row[attr] = localized
+            return localized
     return ""
 
 if __name__ == '__main__':
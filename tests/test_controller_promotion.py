@@ -0,0 +1,49 @@
+import os
+import sys
+import unittest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Modules import each other both as `backend.x` and as plain `x`
+sys.path[:0] = [REPO_DIR, os.path.join(REPO_DIR, "backend")]
+
+from backend.chess_related.board import Board
+from backend.chess_related.piece import PawnPiece, QueenPiece
+from backend.chess_related.status_effect import StatusEffect
+from backend.card_related.card_driver import Card, Deck
+from backend.player_related.player import Player
+from backend.controller_related.event_controller import EventHandler
+from controller import GameController
+
+
+def make_player(name: str) -> Player:
+    cards = [Card(f"c{i}", str(10000 + i), "", "", 1, "attack") for i in range(10)]
+    return Player(username=name, request_sid=f"{name}-sid", system=None, deck=Deck(cards))
+
+
+class PromotionTest(unittest.TestCase):
+    def setUp(self):
+        self.board = Board()
+        self.controller = GameController(
+            "room", self.board, {"white": make_player("w"), "black": make_player("b")}, EventHandler()
+        )
+        self.controller.game_start()
+
+    def test_promoted_piece_loses_card_given_movable(self):
+        # Clear e7/e8 and put a white pawn one step from promotion
+        self.board.remove_piece("e7")
+        self.board.remove_piece("e8")
+        pawn = PawnPiece("white")
+        self.board.place_piece(pawn, "e7")
+        self.controller.add_piece_status(pawn, StatusEffect("card_given_movable"))
+
+        result = self.controller.move_piece({"from": "e7", "to": "e8", "promotion": "q"})
+
+        self.assertTrue(result["success"])
+        promoted = self.board.get_piece_at_square("e8")
+        self.assertIsInstance(promoted, QueenPiece)
+        self.assertEqual(promoted.uuid, pawn.uuid)
+        self.assertFalse(promoted.has_status("card_given_movable"))
+
+
+if __name__ == "__main__":
+    unittest.main()